@@ -4,16 +4,39 @@ Tax lien data aggregation dashboard
 """
 
 import asyncio
+import hashlib
+import io
 from datetime import date
+from operator import attrgetter
+from pathlib import Path
 from typing import Optional, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
-from src.config import STATE_REGISTRY, DEFAULT_METRICS, is_live_scraping_available, get_adapter_for_state
-from src.models import SourcePlatform, TaxLien, LienBatch
-from src.adapters import FileIngestorAdapter, LienHubAdapter
-from src.adapters.file_ingestor import ColumnMappingHelper
+from src.config import STATE_REGISTRY, is_live_scraping_available, get_adapter_for_state
+from src.models import TaxLien, LienBatch
+from src.utils import range_mask, run_sync
+
+# Maximum number of county scrapes (browser pages) running at once
+MAX_CONCURRENT_SCRAPES = 4
+
+# Default cap on liens collected per state scrape (across all counties)
+DEFAULT_MAX_RECORDS = 250
+TABLE_PAGE_SIZE = 50
+
+# Each day's scrape per state is kept on disk so restarts skip the crawl
+BATCH_CACHE_DIR = Path(__file__).parent / "cache"
+
+# State selectbox options and labels, formatted once instead of per option per rerun
+STATE_OPTIONS = tuple(STATE_REGISTRY)
+STATE_LABELS = {code: f"{code} - {cfg.state_name}" for code, cfg in STATE_REGISTRY.items()}
+STATE_LABELS_LIVE = {
+    code: label + (" [LIVE]" if is_live_scraping_available(code) else "")
+    for code, label in STATE_LABELS.items()
+}
 
 # Page configuration
 st.set_page_config(
@@ -23,13 +46,39 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Minimal CSS styling
-CUSTOM_CSS = """
-<style>
-    .main .block-container { max-width: 100%; padding-top: 1rem; }
-</style>"""
+# Page stylesheet (kept as a plain .css file rather than a Python string)
+CSS_PATH = Path(__file__).parent / "assets" / "terminal.css"
 
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+# Static sidebar copy, built once rather than on every render
+HOW_TO_USE_MD = """
+**HOW TO USE**
+
+1. Select a state below
+2. Click FETCH to load liens
+3. Filter results as needed
+4. Export to CSV
+    """
+
+DATA_SOURCES_MD = """
+**DATA SOURCES**
+
+| STATE | STATUS |
+|-------|--------|
+| FL | <span class='status-online'>ONLINE</span> |
+| IL | UPLOAD |
+| AZ | -- |
+| NJ | -- |
+    """
+
+
+@st.cache_resource(show_spinner=False)
+def inject_css() -> bool:
+    """Emit the page stylesheet; reruns replay the cached element."""
+    st.markdown(f"<style>{CSS_PATH.read_text()}</style>", unsafe_allow_html=True)
+    return True
+
+
+inject_css()
 
 
 def init_session_state():
@@ -38,6 +87,43 @@ def init_session_state():
         st.session_state.liens_data = None
     if "last_fetch_time" not in st.session_state:
         st.session_state.last_fetch_time = None
+    if "liens_df" not in st.session_state:
+        st.session_state.liens_df = None
+    if "liens_meta" not in st.session_state:
+        st.session_state.liens_meta = None
+    if "liens_arrow" not in st.session_state:
+        st.session_state.liens_arrow = None
+
+
+def set_liens_data(liens: LienBatch):
+    """Store a newly loaded batch and drop state derived from the previous one."""
+    st.session_state.liens_data = liens
+    st.session_state.liens_df = None
+    st.session_state.liens_arrow = None
+    st.session_state.liens_meta = compute_liens_meta(liens)
+    st.session_state.last_fetch_time = date.today()
+
+
+def compute_liens_meta(liens: LienBatch) -> dict:
+    """Compute the filter-widget bounds that stay fixed for a batch."""
+    face_amounts = liens.face_amounts[liens.face_amounts > 0]
+    ltv = liens.ltv[~np.isnan(liens.ltv)]
+    return {
+        "counties": sorted(liens.counties),
+        "face_min": float(face_amounts.min()) if face_amounts.size else None,
+        "face_max": float(face_amounts.max()) if face_amounts.size else None,
+        # True extents (zero face amounts included) for spotting no-op filters
+        "face_lo": float(liens.face_amounts.min()) if liens.count else None,
+        "face_hi": float(liens.face_amounts.max()) if liens.count else None,
+        "ltv_hi": float(ltv.max()) if ltv.size else None,
+    }
+
+
+def get_liens_meta(liens: LienBatch) -> dict:
+    """Return the filter bounds for the loaded batch, computing them once."""
+    if st.session_state.liens_meta is None:
+        st.session_state.liens_meta = compute_liens_meta(liens)
+    return st.session_state.liens_meta
 
 
 def render_sidebar():
@@ -46,14 +132,7 @@ def render_sidebar():
     st.sidebar.markdown("---")
 
     # Instructions - always visible
-    st.sidebar.markdown("""
-**HOW TO USE**
-
-1. Select a state below
-2. Click FETCH to load liens
-3. Filter results as needed
-4. Export to CSV
-    """)
+    st.sidebar.markdown(HOW_TO_USE_MD)
 
     st.sidebar.markdown("---")
 
@@ -63,16 +142,14 @@ def render_sidebar():
         st.sidebar.markdown("---")
 
     # Supported sources
-    st.sidebar.markdown("""
-**DATA SOURCES**
+    st.sidebar.markdown(DATA_SOURCES_MD, unsafe_allow_html=True)
 
-| STATE | STATUS |
-|-------|--------|
-| FL | <span class='status-online'>ONLINE</span> |
-| IL | UPLOAD |
-| AZ | -- |
-| NJ | -- |
-    """, unsafe_allow_html=True)
+    # Cached scrapes/uploads are reused (in memory for an hour, on disk for
+    # the day); allow a forced refresh
+    if st.sidebar.button("[ CLEAR CACHE ]", use_container_width=True, key="clear_cache"):
+        scrape_all_counties.clear()
+        process_uploaded_file.clear()
+        clear_batch_cache()
 
     # Status footer
     st.sidebar.markdown("---")
@@ -99,9 +176,9 @@ def render_filter_controls():
     )
 
     # Face amount filter
-    face_amounts = [l.face_amount for l in liens.liens if l.face_amount]
-    if face_amounts:
-        min_f, max_f = min(face_amounts), max(face_amounts)
+    meta = get_liens_meta(liens)
+    if meta["face_min"] is not None:
+        min_f, max_f = meta["face_min"], meta["face_max"]
         face_range = st.sidebar.slider(
             "FACE AMT $",
             min_value=float(min_f),
@@ -113,7 +190,7 @@ def render_filter_controls():
         face_range = (0.0, 100000.0)
 
     # County filter
-    counties = sorted(set(l.county for l in liens.liens))
+    counties = meta["counties"]
     if len(counties) > 1:
         selected_counties = st.sidebar.multiselect(
             "COUNTIES",
@@ -132,6 +209,8 @@ def render_filter_controls():
 
 async def scrape_county(county_slug: str) -> List[TaxLien]:
     """Scrape a single county."""
+    from src.adapters import LienHubAdapter
+
     try:
         adapter = LienHubAdapter(state="FL", county=county_slug, headless=True)
         batch = await adapter.fetch(max_records=200)
@@ -145,102 +224,216 @@ async def scrape_county(county_slug: str) -> List[TaxLien]:
         return []
 
 
-def scrape_all_counties(state: str) -> LienBatch:
-    """Scrape all counties for a state using the appropriate adapter."""
-    import nest_asyncio
-    nest_asyncio.apply()
+def batch_cache_path(state: str, max_total: int) -> Path:
+    """Path of today's on-disk scrape cache for a state and record cap."""
+    return BATCH_CACHE_DIR / f"{state}_{date.today():%Y%m%d}_{max_total}.parquet"
+
+
+def clear_batch_cache():
+    """Delete every on-disk scrape cache file."""
+    for path in BATCH_CACHE_DIR.glob("*.parquet"):
+        path.unlink(missing_ok=True)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def scrape_all_counties(state: str, max_total: int = DEFAULT_MAX_RECORDS) -> LienBatch:
+    """Scrape counties for a state, stopping once max_total liens are collected."""
+    cache_path = batch_cache_path(state, max_total)
+    if cache_path.exists():
+        try:
+            return LienBatch.from_parquet(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable scrape cache {cache_path}: {e}")
 
     async def _scrape():
         adapter = get_adapter_for_state(state, headless=True)
         counties = adapter.get_available_counties()
 
+        # One long-lived Chromium (per adapter launch flags) serves every county
+        browser = await type(adapter).shared_browser(headless=True)
+
         # For states with many counties, limit to first 5
         if len(counties) > 5:
             print(f"Limiting to first 5 counties (of {len(counties)} total)")
             counties = counties[:5]
 
+        # Each county is an independent browser session; overlap them but cap
+        # how many Chromium pages are open at once
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        collected = 0
+        tasks = []
+
+        async def _scrape_one(county: str, browser) -> LienBatch:
+            nonlocal collected
+            async with semaphore:
+                print(f"  Scraping {county}...")
+                county_adapter = get_adapter_for_state(
+                    state, county=county, headless=True, browser=browser
+                )
+                batch = await county_adapter.fetch(max_records=max_total - collected)
+                print(f"    Found {len(batch.liens)} liens in {county}")
+
+                # Once the cap is reached, stop counties still queued or running
+                collected += len(batch.liens)
+                if collected >= max_total:
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+                return batch
+
+        # Each county opens its own context on the shared browser
+        tasks.extend(asyncio.ensure_future(_scrape_one(county, browser)) for county in counties)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
         all_liens = []
         source_url = getattr(adapter, 'base_url', '')
 
-        for county in counties:
-            try:
-                print(f"  Scraping {county}...")
-                county_adapter = get_adapter_for_state(state, county=county, headless=True)
-                batch = await county_adapter.fetch(max_records=50)
-                if batch.liens:
-                    all_liens.extend(batch.liens)
-                    print(f"    Found {len(batch.liens)} liens")
-                    source_url = batch.source_url or source_url
-            except Exception as e:
-                print(f"  Error scraping {county}: {e}")
+        for county, result in zip(counties, results):
+            if isinstance(result, asyncio.CancelledError):
                 continue
+            if isinstance(result, Exception):
+                print(f"  Error scraping {county}: {result}")
+                continue
+            if result.liens:
+                all_liens.extend(result.liens)
+                source_url = result.source_url or source_url
 
-        return all_liens, source_url
+        return all_liens[:max_total], source_url
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        liens, source_url = loop.run_until_complete(_scrape())
-    finally:
-        loop.close()
+    liens, source_url = run_sync(_scrape())
 
-    return LienBatch(
+    batch = LienBatch(
         liens=liens,
         source_url=source_url,
         scrape_timestamp=date.today(),
         state_filter=state,
     )
 
+    if batch.liens:
+        try:
+            batch.to_parquet(cache_path)
+        except Exception as e:
+            print(f"Could not write scrape cache {cache_path}: {e}")
+
+    return batch
+
 
+@st.cache_data(
+    ttl=3600,
+    show_spinner=False,
+    hash_funcs={bytes: lambda b: hashlib.sha1(b).digest()},
+)
 def process_uploaded_file(file_content: bytes, state: str, county: Optional[str]) -> LienBatch:
     """Process uploaded file."""
+    from src.adapters import FileIngestorAdapter
+
     async def _process():
         adapter = FileIngestorAdapter(state=state, county=county, file_content=file_content)
         return await adapter.fetch()
-    return asyncio.run(_process())
+    return run_sync(_process())
+
+
+# Shared stand-in for liens without raw_data (never mutated)
+_EMPTY_RAW: dict = {}
 
 
 def lien_batch_to_dataframe(batch: LienBatch) -> pd.DataFrame:
     """Convert LienBatch to DataFrame with source links."""
-    records = []
-    for lien in batch.liens:
-        source_url = lien.raw_data.get("source_url", "") if lien.raw_data else ""
-        records.append({
-            "COUNTY": lien.county,
-            "PARCEL ID": lien.parcel_id,
-            "FACE AMT": lien.face_amount,
-            "ASSESSED": lien.assessed_value,
-            "LTV %": lien.lien_to_value_ratio,
-            "TAX YR": lien.raw_data.get("tax_year") if lien.raw_data else None,
-            "ISSUED": lien.raw_data.get("issued_date") if lien.raw_data else None,
-            "SOURCE": source_url,
-        })
-    return pd.DataFrame(records)
-
-
-def apply_filters(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply user filters."""
+    # One C-level pass over the models for the remaining object columns
+    fields = attrgetter("county", "parcel_id", "raw_data")
+    counties, parcel_ids, raws = zip(*map(fields, batch.liens)) if batch.liens else ((), (), ())
+
+    # Single pass over raw_data for the three scraped-detail columns
+    details = [
+        (r.get("tax_year"), r.get("issued_date"), r.get("source_url", ""))
+        for r in (raw or _EMPTY_RAW for raw in raws)
+    ]
+    tax_years, issued, sources = zip(*details) if details else ((), (), ())
+
+    # Build column-at-a-time so pandas infers each dtype once
+    df = pd.DataFrame({
+        # Few distinct counties repeated per row: store as small int codes
+        "COUNTY": pd.Categorical(counties),
+        "PARCEL ID": list(parcel_ids),
+        "FACE AMT": batch.face_amounts,
+        "ASSESSED": batch.assessed_values,
+        "LTV %": batch.ltv,
+        "TAX YR": list(tax_years),
+        "ISSUED": list(issued),
+        "SOURCE": list(sources),
+    })
+
+    # Narrow TAX YR to Int16 only when every present value is a whole number
+    # that fits; anything else (e.g. "2023-24", 2023.5) keeps the original column
+    tax_yr = pd.to_numeric(df["TAX YR"], errors="coerce")
+    present = tax_yr.dropna()
+    if (
+        len(present) == df["TAX YR"].notna().sum()
+        and (present % 1 == 0).all()
+        and present.between(-32768, 32767).all()
+    ):
+        df["TAX YR"] = tax_yr.astype("Int16")
+
+    return df
+
+
+def get_liens_dataframe(liens: LienBatch) -> pd.DataFrame:
+    """Return the table for the loaded batch, converting it once per fetch."""
+    if st.session_state.liens_df is None:
+        st.session_state.liens_df = lien_batch_to_dataframe(liens)
+    return st.session_state.liens_df
+
+
+def get_liens_arrow(df: pd.DataFrame) -> pa.Table:
+    """Return the loaded table as Arrow, converting it once per fetch."""
+    # st.dataframe sends Arrow to the browser; Arrow slices skip re-conversion
+    if st.session_state.liens_arrow is None:
+        st.session_state.liens_arrow = pa.Table.from_pandas(df, preserve_index=False)
+    return st.session_state.liens_arrow
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize the export CSV, reusing it until the filtered rows change."""
+    # Write straight into a byte buffer instead of building a str and encoding it
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+
+def build_filter_mask(df: pd.DataFrame, meta: dict) -> np.ndarray:
+    """Combine the user filters into one boolean row mask."""
+    mask = np.ones(len(df), dtype=bool)
     if "filters" not in st.session_state:
-        return df
+        return mask
 
     f = st.session_state.filters
-    filtered = df.copy()
 
-    if "LTV %" in filtered.columns:
-        filtered = filtered[
-            (filtered["LTV %"].isna()) | (filtered["LTV %"] <= f["max_ltv"])
-        ]
-
-    if "FACE AMT" in filtered.columns:
-        min_f, max_f = f["face_range"]
-        filtered = filtered[
-            (filtered["FACE AMT"] >= min_f) & (filtered["FACE AMT"] <= max_f)
-        ]
+    # Skip predicates that cannot exclude any row of this batch
+    min_f, max_f = f["face_range"]
+    ltv_active = meta["ltv_hi"] is not None and f["max_ltv"] < meta["ltv_hi"]
+    face_active = meta["face_lo"] is not None and (min_f > meta["face_lo"] or max_f < meta["face_hi"])
+    counties_active = "counties" in f and not set(f["counties"]) >= set(meta["counties"])
+
+    if (ltv_active or face_active) and "LTV %" in df.columns and "FACE AMT" in df.columns:
+        mask &= range_mask(
+            df["LTV %"].to_numpy(dtype=np.float64, na_value=np.nan),
+            df["FACE AMT"].to_numpy(dtype=np.float64, na_value=np.nan),
+            f["max_ltv"] if ltv_active else np.inf,
+            min_f if face_active else -np.inf,
+            max_f if face_active else np.inf,
+        )
 
-    if "COUNTY" in filtered.columns and "counties" in f:
-        filtered = filtered[filtered["COUNTY"].isin(f["counties"])]
+    if counties_active and "COUNTY" in df.columns:
+        county = df["COUNTY"]
+        if isinstance(county.dtype, pd.CategoricalDtype):
+            # Compare integer codes instead of strings row by row
+            wanted = county.cat.categories.get_indexer(f["counties"])
+            mask &= np.isin(county.cat.codes.to_numpy(), wanted[wanted >= 0])
+        else:
+            mask &= county.isin(f["counties"]).to_numpy()
 
-    return filtered
+    return mask
 
 
 def render_main_content():
@@ -258,26 +451,33 @@ def render_main_content():
         st.warning("NO DATA FOUND. SELECT A STATE OR UPLOAD A FILE.")
         return
 
-    # Metrics row
+    df = get_liens_dataframe(liens)
+
+    # Metrics row (batch invariants, computed once per batch)
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("TOTAL LIENS", f"{liens.count:,}")
     with col2:
         st.metric("FACE VALUE", f"${liens.total_face_amount:,.0f}")
     with col3:
-        counties = len(set(l.county for l in liens.liens))
-        st.metric("COUNTIES", counties)
+        st.metric("COUNTIES", len(liens.counties))
     with col4:
         st.metric("UPDATED", st.session_state.last_fetch_time.strftime("%Y-%m-%d"))
 
     st.markdown("---")
 
-    # Data table
-    df = lien_batch_to_dataframe(liens)
-    filtered_df = apply_filters(df)
+    render_liens_table(df)
+
 
-    if len(filtered_df) < len(df):
-        st.info(f"DISPLAYING {len(filtered_df)} OF {len(df)} RECORDS")
+@st.fragment
+def render_liens_table(df: pd.DataFrame):
+    """Render the filtered table and export; paging reruns only this fragment."""
+    # Count and page from the mask; only the visible rows are gathered
+    keep = np.flatnonzero(build_filter_mask(df, get_liens_meta(st.session_state.liens_data)))
+    n_keep = len(keep)
+
+    if n_keep < len(df):
+        st.info(f"DISPLAYING {n_keep} OF {len(df)} RECORDS")
 
     # Configure columns
     column_config = {
@@ -287,8 +487,23 @@ def render_main_content():
         "SOURCE": st.column_config.LinkColumn("SOURCE", display_text="VIEW →"),
     }
 
+    # Page the table server-side so only the visible rows are serialized
+    n_pages = max(1, -(-n_keep // TABLE_PAGE_SIZE))
+    page = 1
+    if n_pages > 1:
+        page = int(st.number_input(
+            f"PAGE (OF {n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            step=1,
+            key="table_page",
+        ))
+    start = (page - 1) * TABLE_PAGE_SIZE
+    view = get_liens_arrow(df).take(keep[start:start + TABLE_PAGE_SIZE])
+
     st.dataframe(
-        filtered_df,
+        view,
         column_config=column_config,
         use_container_width=True,
         height=500,
@@ -297,7 +512,7 @@ def render_main_content():
 
     # Export
     st.markdown("")
-    csv = filtered_df.to_csv(index=False)
+    csv = df_to_csv_bytes(df.iloc[keep] if n_keep < len(df) else df)
     st.download_button(
         "[ EXPORT CSV ]",
         csv,
@@ -323,8 +538,8 @@ def render_welcome():
             st.markdown("")
             state = st.selectbox(
                 "STATE",
-                options=list(STATE_REGISTRY.keys()),
-                format_func=lambda x: f"{x} - {STATE_REGISTRY[x].state_name}" + (" [LIVE]" if is_live_scraping_available(x) else ""),
+                options=STATE_OPTIONS,
+                format_func=STATE_LABELS_LIVE.get,
                 label_visibility="collapsed"
             )
 
@@ -338,6 +553,15 @@ def render_welcome():
                 st.warning(f"⚠ {config.notes}")
                 st.caption(f"Platform: {config.primary_adapter.__name__} | Try scraping anyway or use file upload.")
 
+            max_total = st.number_input(
+                "MAX RECORDS",
+                min_value=50,
+                max_value=1000,
+                value=DEFAULT_MAX_RECORDS,
+                step=50,
+                key="max_records",
+            )
+
             st.markdown("")
 
             # Allow scraping attempt for all states
@@ -345,10 +569,9 @@ def render_welcome():
             if st.button(btn_label, type="primary", use_container_width=True, key="fetch_main"):
                 with st.spinner(f"SCANNING {state}..."):
                     try:
-                        liens = scrape_all_counties(state)
+                        liens = scrape_all_counties(state, int(max_total))
                         if liens:
-                            st.session_state.liens_data = liens
-                            st.session_state.last_fetch_time = date.today()
+                            set_liens_data(liens)
                             st.rerun()
                         else:
                             st.warning(f"No data returned. Platform may require registration. Try file upload.")
@@ -360,8 +583,8 @@ def render_welcome():
             st.markdown("")
             upload_state = st.selectbox(
                 "STATE",
-                options=list(STATE_REGISTRY.keys()),
-                format_func=lambda x: f"{x} - {STATE_REGISTRY[x].state_name}",
+                options=STATE_OPTIONS,
+                format_func=STATE_LABELS.get,
                 key="upload_state_main",
                 label_visibility="collapsed"
             )
@@ -379,8 +602,7 @@ def render_welcome():
                     with st.spinner("PROCESSING..."):
                         try:
                             liens = process_uploaded_file(uploaded_file.getvalue(), upload_state, county or None)
-                            st.session_state.liens_data = liens
-                            st.session_state.last_fetch_time = date.today()
+                            set_liens_data(liens)
                             st.rerun()
                         except Exception as e:
                             st.error(f"ERROR: {str(e)}")
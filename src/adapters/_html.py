@@ -0,0 +1,100 @@
+"""lxml helpers shared by the table-scraping adapters."""
+
+from typing import Iterator, Optional, Union
+
+from lxml import etree, html as lxml_html
+
+
+# Cells of a row, including those of nested tables (like BeautifulSoup's find_all)
+_ROW_CELLS = etree.XPath(".//td | .//th")
+
+
+def parse_document(
+    html: Union[str, bytes],
+    encoding: Optional[str] = None,
+    strip: tuple[str, ...] = ("script", "style"),
+) -> Optional[lxml_html.HtmlElement]:
+    """
+    Parse page markup with lxml and drop elements whose text isn't page text.
+
+    Args:
+        html: Page markup, or raw response bytes
+        encoding: Encoding of raw bytes (None lets lxml detect it)
+        strip: Tags removed along with their text (their tails are kept)
+
+    Returns:
+        Document root, or None if there is nothing to parse (empty input or
+        no elements at all, e.g. only a comment)
+    """
+    if not html or not html.strip():
+        return None
+
+    parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+    try:
+        doc = lxml_html.fromstring(html, parser=parser)
+    except etree.ParserError:
+        return None
+    etree.strip_elements(doc, *strip, with_tail=False)
+    return doc
+
+
+def cell_text(cell) -> str:
+    """Concatenate a cell's stripped text fragments (like get_text(strip=True))."""
+    if not len(cell):
+        # Leaf cell (the common case): its text is the only fragment
+        return (cell.text or "").strip()
+    return "".join(t.strip() for t in cell.itertext())
+
+
+def iter_table_rows(
+    html: Union[str, bytes], encoding: Optional[str] = None
+) -> Iterator[Iterator[list[str]]]:
+    """
+    Walk every table on a page as rows of cell texts.
+
+    Script/style bodies are skipped. Tables and rows are produced lazily, so
+    a caller that stops early doesn't pay for the rest of the page.
+
+    Args:
+        html: Page markup, or raw response bytes
+        encoding: Encoding of raw bytes (None lets lxml detect it)
+
+    Yields:
+        One iterator per table, yielding a list of cell texts per row
+    """
+    doc = parse_document(html, encoding)
+    if doc is None:
+        return
+    for table in doc.iter("table"):
+        yield ([cell_text(c) for c in _ROW_CELLS(row)] for row in table.iterdescendants("tr"))
+
+
+def index_headers(
+    headers: list[str], field_keywords: dict[str, tuple[str, ...]]
+) -> dict[str, tuple[str, ...]]:
+    """
+    Map each lien field to its matching header keys, in column order.
+
+    Resolved once per table; a header matches a field if it contains any of
+    the field's keywords.
+
+    Args:
+        headers: Lowercased header cells of a table
+        field_keywords: Keywords per lien field
+
+    Returns:
+        Dict of field name to matching header keys
+    """
+    keys = list(dict.fromkeys(headers))
+    return {
+        field: tuple(k for k in keys if any(kw in k for kw in keywords))
+        for field, keywords in field_keywords.items()
+    }
+
+
+def lookup(data: dict, keys: tuple[str, ...]) -> Optional[str]:
+    """Value of the first header key present in the row (short rows lack trailing keys)."""
+    for key in keys:
+        if key in data:
+            return data[key]
+    return None
@@ -1,13 +1,45 @@
 """Arizona Tax Sale adapter for AZ county tax lien auctions."""
 
+import codecs
 import re
 from datetime import date
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from ._html import index_headers, iter_table_rows, lookup
 from .base import ScrapingSource
 from ..models import TaxLien, LienBatch, SourcePlatform
+from ..utils.parsing import CURRENCY_CHARS_RE
+
+
+# Treasurer pages are only scanned for links; skip building the rest of the tree
+_LINK_STRAINER = SoupStrainer("a", href=True)
+
+
+# Header keywords per lien field; a header matches if it contains any keyword
+_FIELD_KEYWORDS = {
+    "parcel_id": ("parcel", "account", "pin"),
+    "address": ("address", "location", "situs"),
+    "assessed_value": ("assessed", "value", "full cash"),
+    "face_amount": ("amount", "due", "total", "minimum"),
+}
+
+
+# Raw response bytes are only parsed when the server declares their encoding
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+def _response_charset(headers: dict) -> Optional[str]:
+    """Charset declared in a response's Content-Type header, if any (and known)."""
+    match = _CHARSET_RE.search(headers.get("content-type", ""))
+    if not match:
+        return None
+    try:
+        codecs.lookup(match.group(1))
+    except LookupError:  # e.g. "utf8mb4", "none"
+        return None
+    return match.group(1)
 
 
 # Arizona counties and their tax sale platforms
@@ -95,6 +127,13 @@ ARIZONA_COUNTIES = {
 }
 
 
+# Display names in registry order, built once at import
+_COUNTY_NAMES = tuple(info["name"] for info in ARIZONA_COUNTIES.values())
+
+# Space-free county name -> ARIZONA_COUNTIES key ("santacruz" -> "santa cruz")
+_COUNTY_SLUG_MAP = {key.replace(" ", ""): key for key in ARIZONA_COUNTIES}
+
+
 class ArizonaTaxSaleAdapter(ScrapingSource):
     """
     Scraper for Arizona Tax Sale - statewide tax lien auction platform.
@@ -110,6 +149,11 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
     supported_states = ["AZ"]
     requires_auth = True
     base_url = "https://arizonataxsale.com"
+    launch_args = [
+        "--disable-blink-features=AutomationControlled",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+    ]
 
     # Arizona statutory max interest rate
     MAX_INTEREST_RATE = 16.0
@@ -122,8 +166,9 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
         headless: bool = True,
         timeout: Optional[int] = None,
         credentials: Optional[Dict[str, str]] = None,
+        browser: Optional[Any] = None,
     ):
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.credentials = credentials
         self.county_slug = self._get_county_slug()
 
@@ -133,19 +178,20 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
             return "maricopa"  # Default to largest county
 
         slug = self.county.lower().replace(" ", "")
-        if slug in ARIZONA_COUNTIES:
-            return slug
+        key = _COUNTY_SLUG_MAP.get(slug)
+        if key:
+            return key
 
         # Try fuzzy match
-        for key in ARIZONA_COUNTIES:
-            if slug in key or key in slug:
+        for compact, key in _COUNTY_SLUG_MAP.items():
+            if slug in compact or compact in slug:
                 return key
 
         return "maricopa"
 
     def get_available_counties(self) -> list[str]:
         """Get list of Arizona counties with tax sale sites."""
-        return [info["name"] for info in ARIZONA_COUNTIES.values()]
+        return list(_COUNTY_NAMES)
 
     def get_county_url(self) -> str:
         """Get the auction URL for the configured county."""
@@ -154,17 +200,7 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
 
     async def _init_browser(self):
         """Initialize Playwright browser with anti-detection settings."""
-        from playwright.async_api import async_playwright
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ]
-        )
+        self._browser = await self._launch_browser()
         self._context = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -188,6 +224,8 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
             This platform typically returns 403 without valid session/registration.
             For live data, register at arizonataxsale.com.
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         liens = []
         url = self.get_county_url()
 
@@ -205,9 +243,26 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
                     print("Arizona Tax Sale requires bidder registration to view auction data.")
                     print(f"Visit {url} to register for the {self.county_slug.title()} County auction.")
                 else:
-                    await page.wait_for_timeout(3000)
-                    html = await page.content()
-                    liens = self._parse_auction_page(html)
+                    # Server-rendered pages already carry the table; parse the
+                    # raw bytes and skip serializing the live DOM
+                    charset = _response_charset(response.headers) if response else None
+                    if charset:
+                        try:
+                            liens = self._parse_auction_page(await response.body(), encoding=charset)
+                        except (LookupError, ValueError):
+                            # libxml2 rejects some codecs Python knows (e.g. "rot13");
+                            # fall through to the rendered DOM
+                            liens = []
+
+                    if not liens:
+                        # Rows are rendered client-side; wait for the table
+                        # rather than a fixed sleep
+                        try:
+                            await page.wait_for_selector("table", timeout=3000)
+                        except PlaywrightTimeoutError:
+                            pass
+                        html = await page.content()
+                        liens = self._parse_auction_page(html)
 
                 if liens:
                     print(f"Found {len(liens)} liens")
@@ -216,7 +271,15 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
                     treasurer_url = ARIZONA_COUNTIES.get(self.county_slug, {}).get("treasurer_url")
                     if treasurer_url:
                         print(f"Trying treasurer site: {treasurer_url}")
-                        await page.goto(treasurer_url, wait_until="networkidle")
+                        await page.goto(treasurer_url, wait_until="domcontentloaded")
+                        # Only the resource links are parsed; don't wait on trackers
+                        try:
+                            await page.wait_for_selector(
+                                'a[href]:has-text("delinquent"), a[href]:has-text("tax lien")',
+                                timeout=3000,
+                            )
+                        except PlaywrightTimeoutError:
+                            pass
                         html = await page.content()
                         liens = self._parse_treasurer_page(html)
 
@@ -235,61 +298,54 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
             county_filter=self.county or self.county_slug.title()
         )
 
-    def _parse_auction_page(self, html: str) -> list[TaxLien]:
-        """Parse Arizona Tax Sale auction page into TaxLien records."""
-        soup = BeautifulSoup(html, "lxml")
-        liens = []
+    def _parse_auction_page(
+        self, html: Union[str, bytes], encoding: Optional[str] = None
+    ) -> list[TaxLien]:
+        """Parse Arizona Tax Sale auction page (markup or raw response bytes) into TaxLien records."""
+        county = self.county or self.county_slug.title()
+        records = []
 
-        # Look for property tables
-        tables = soup.find_all("table")
-
-        for table in tables:
-            rows = table.find_all("tr")
+        for rows in iter_table_rows(html, encoding):
             headers = []
+            field_keys = {}
 
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                cell_texts = [c.get_text(strip=True) for c in cells]
-
+            for cell_texts in rows:
                 # Detect header row
                 if any("parcel" in t.lower() or "amount" in t.lower() for t in cell_texts):
                     headers = [t.lower() for t in cell_texts]
+                    field_keys = index_headers(headers, _FIELD_KEYWORDS)
                     continue
 
-                if len(cells) < 3 or not headers:
+                if len(cell_texts) < 3 or not headers:
                     continue
 
-                try:
-                    data = dict(zip(headers, cell_texts))
-                    parcel_id = self._find_field(data, ["parcel", "account", "pin"])
-                    if not parcel_id:
-                        continue
-
-                    lien = TaxLien(
-                        state="AZ",
-                        county=self.county or self.county_slug.title(),
-                        parcel_id=parcel_id,
-                        address=self._find_field(data, ["address", "location", "situs"]),
-                        assessed_value=self._parse_currency(
-                            self._find_field(data, ["assessed", "value", "full cash"])
-                        ),
-                        face_amount=self._parse_currency(
-                            self._find_field(data, ["amount", "due", "total", "minimum"])
-                        ) or 0.0,
-                        interest_rate_bid=self.MAX_INTEREST_RATE,
-                        auction_date=None,
-                        source_platform=SourcePlatform.REALAUCTION,
-                        raw_data=data
-                    )
-                    liens.append(lien)
-                except Exception:
+                data = dict(zip(headers, cell_texts))
+                parcel_id = lookup(data, field_keys["parcel_id"])
+                if not parcel_id:
                     continue
 
-        return liens
+                records.append({
+                    "state": "AZ",
+                    "county": county,
+                    "parcel_id": parcel_id,
+                    "address": lookup(data, field_keys["address"]),
+                    "assessed_value": self._parse_currency(
+                        lookup(data, field_keys["assessed_value"])
+                    ),
+                    "face_amount": self._parse_currency(
+                        lookup(data, field_keys["face_amount"])
+                    ) or 0.0,
+                    "interest_rate_bid": self.MAX_INTEREST_RATE,
+                    "auction_date": None,
+                    "source_platform": SourcePlatform.REALAUCTION,
+                    "raw_data": data,
+                })
+
+        return TaxLien.from_records(records)
 
     def _parse_treasurer_page(self, html: str) -> list[TaxLien]:
         """Parse treasurer delinquent tax page for basic info."""
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_LINK_STRAINER)
         liens = []
 
         # Look for links to delinquent lists or maps
@@ -301,21 +357,13 @@ class ArizonaTaxSaleAdapter(ScrapingSource):
 
         return liens
 
-    def _find_field(self, data: dict, keywords: list) -> Optional[str]:
-        """Find a field value by keyword matching."""
-        for key, value in data.items():
-            for keyword in keywords:
-                if keyword in key.lower():
-                    return value
-        return None
-
     @staticmethod
     def _parse_currency(value: Optional[str]) -> Optional[float]:
         """Parse currency string to float."""
         if not value:
             return None
         try:
-            cleaned = re.sub(r"[$,\s]", "", value)
+            cleaned = CURRENCY_CHARS_RE.sub("", value)
             return float(cleaned) if cleaned else None
         except (ValueError, TypeError):
             return None
@@ -1,7 +1,8 @@
 """Abstract base class for tax lien data sources (Strategy Pattern)."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 from ..models import LienBatch, SourcePlatform
 
@@ -73,6 +74,13 @@ class LienSource(ABC):
         return f"<{self.__class__.__name__}(state={self.state}, county={self.county})>"
 
 
+# Chromium flags used when one browser is shared across several adapters
+SHARED_BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+]
+
+
 class ScrapingSource(LienSource):
     """
     Extended base class for sources that require web scraping.
@@ -82,13 +90,22 @@ class ScrapingSource(LienSource):
 
     base_url: str = ""
     default_timeout: int = 30000  # 30 seconds
+    launch_args: list[str] = SHARED_BROWSER_ARGS
+
+    # Process-wide browsers keyed by (launch args, headless), stored as
+    # (playwright, browser, loop); an entry only works on the loop that launched it
+    _shared_browsers: dict = {}
+    # Serializes launches so concurrent callers don't start duplicate browsers
+    _shared_lock: Optional[asyncio.Lock] = None
+    _shared_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __init__(
         self,
         state: str,
         county: Optional[str] = None,
         headless: bool = True,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        browser: Optional[Any] = None
     ):
         """
         Initialize scraping source.
@@ -98,19 +115,88 @@ class ScrapingSource(LienSource):
             county: Optional county name filter
             headless: Whether to run browser in headless mode
             timeout: Request timeout in milliseconds
+            browser: Already-launched Playwright browser to share. When given,
+                     each fetch only opens a new context and the browser is
+                     left running on exit.
         """
         super().__init__(state, county)
         self.headless = headless
         self.timeout = timeout or self.default_timeout
+        self._shared_browser = browser
+        self._playwright = None
         self._browser = None
         self._context = None
 
-    async def _init_browser(self):
-        """Initialize Playwright browser instance."""
+    @classmethod
+    async def shared_browser(cls, headless: bool = True):
+        """
+        Get a long-lived Chromium launched with this adapter's launch_args.
+
+        The browser is started on first use and reused by later calls on the
+        same event loop. It is relaunched if it has disconnected or was
+        launched on a different loop (e.g. an earlier asyncio.run()). Pass it
+        to adapters via the ``browser`` argument so each fetch only opens a
+        new context.
+
+        Args:
+            headless: Whether to run browser in headless mode
+
+        Returns:
+            Shared Playwright browser
+        """
+        loop = asyncio.get_running_loop()
+        if ScrapingSource._shared_lock is None or ScrapingSource._shared_lock_loop is not loop:
+            ScrapingSource._shared_lock = asyncio.Lock()
+            ScrapingSource._shared_lock_loop = loop
+
+        key = (tuple(cls.launch_args), headless)
+        async with ScrapingSource._shared_lock:
+            entry = ScrapingSource._shared_browsers.get(key)
+            if entry is not None and entry[2] is not loop:
+                # Its connection lives on another (likely closed) loop and
+                # can't be awaited from here; drop it and launch afresh
+                entry = None
+            if entry is None or not entry[1].is_connected():
+                from playwright.async_api import async_playwright
+
+                if entry is not None:
+                    await entry[0].stop()
+                playwright = await async_playwright().start()
+                browser = await playwright.chromium.launch(headless=headless, args=list(cls.launch_args))
+                entry = ScrapingSource._shared_browsers[key] = (playwright, browser, loop)
+        return entry[1]
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared browsers started by shared_browser() on the running loop."""
+        loop = asyncio.get_running_loop()
+        entries = list(ScrapingSource._shared_browsers.values())
+        ScrapingSource._shared_browsers.clear()
+        ScrapingSource._shared_lock = None
+        ScrapingSource._shared_lock_loop = None
+        for playwright, browser, owner in entries:
+            if owner is not loop:
+                continue  # bound to another loop; nothing can be awaited on it
+            try:
+                await browser.close()
+            finally:
+                await playwright.stop()
+
+    async def _launch_browser(self, args: Optional[list[str]] = None):
+        """Return the shared browser if one was injected, else launch Chromium."""
+        if self._shared_browser is not None:
+            return self._shared_browser
+
         from playwright.async_api import async_playwright
 
         self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return await self._playwright.chromium.launch(
+            headless=self.headless, args=args if args is not None else self.launch_args
+        )
+
+    async def _init_browser(self):
+        """Initialize Playwright browser instance."""
+        self._browser = await self._launch_browser()
         self._context = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -120,9 +206,9 @@ class ScrapingSource(LienSource):
         """Clean up browser resources."""
         if self._context:
             await self._context.close()
-        if self._browser:
+        if self._browser and self._browser is not self._shared_browser:
             await self._browser.close()
-        if hasattr(self, "_playwright") and self._playwright:
+        if self._playwright:
             await self._playwright.stop()
 
     async def __aenter__(self):
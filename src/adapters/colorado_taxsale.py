@@ -1,18 +1,66 @@
 """Colorado Tax Sale adapter for CO county tax lien auctions."""
 
-import re
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Optional, Dict
-
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Optional, Dict, Iterable, Iterator, Mapping
 
+from ._html import index_headers, iter_table_rows, lookup
 from .base import ScrapingSource
 from ..models import TaxLien, LienBatch, SourcePlatform
+from ..utils.parsing import CURRENCY_CHARS_RE
+
+
+logger = logging.getLogger(__name__)
+
+
+# A row containing any of these (lowercased) is a table's header row
+_HEADER_MARKERS = ("parcel", "schedule", "amount")
+
+# Header keywords per lien field; a header matches if it contains any keyword
+_FIELD_KEYWORDS = {
+    "parcel_id": ("parcel", "schedule", "account", "pin"),
+    "address": ("address", "location", "situs", "property"),
+    "assessed_value": ("assessed", "value", "actual"),
+    "face_amount": ("amount", "due", "total", "tax", "delinquent"),
+}
+
+
+# Returns every table as rows of cell texts, mirroring _html.iter_table_rows():
+# each cell's text nodes are trimmed and joined, skipping script/style bodies
+_TABLE_TEXT_JS = """
+() => {
+    const cellText = (cell) => {
+        const walker = document.createTreeWalker(cell, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            if (!node.parentElement.closest('script, style')) {
+                parts.push(node.nodeValue.trim());
+            }
+        }
+        return parts.join('');
+    };
+    return Array.from(document.querySelectorAll('table'), (table) =>
+        Array.from(table.querySelectorAll('tr'), (tr) =>
+            Array.from(tr.querySelectorAll('td, th'), cellText)
+        )
+    );
+}
+"""
 
 
 # Colorado counties and their tax sale platforms
 # Colorado uses a mix of coloradotaxsale.com, zeusauction.com, and realauction.com
-COLORADO_COUNTIES = {
+_COLORADO_COUNTIES = {
     # Counties using coloradotaxsale.com
     "adams": {
         "name": "Adams",
@@ -120,6 +168,11 @@ COLORADO_COUNTIES = {
     },
 }
 
+# Read-only view of the static county table; handed out without copying
+COLORADO_COUNTIES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {slug: MappingProxyType(info) for slug, info in _COLORADO_COUNTIES.items()}
+)
+
 # Additional smaller counties
 ADDITIONAL_CO_COUNTIES = [
     "Alamosa", "Baca", "Bent", "Broomfield", "Chaffee", "Cheyenne", "Clear Creek",
@@ -132,6 +185,29 @@ ADDITIONAL_CO_COUNTIES = [
 ]
 
 
+# Space-free slug -> COLORADO_COUNTIES key ("elpaso" -> "el paso")
+_COUNTY_SLUG_MAP = {key.replace(" ", ""): key for key in COLORADO_COUNTIES}
+
+
+@lru_cache(maxsize=256)
+def _resolve_county_slug(county: Optional[str]) -> str:
+    """Resolve a county name to its COLORADO_COUNTIES key (Denver if unknown)."""
+    if not county:
+        return "denver"  # Default to Denver
+
+    slug = county.lower().replace(" ", "")
+    key = _COUNTY_SLUG_MAP.get(slug)
+    if key:
+        return key
+
+    # Try fuzzy match
+    for compact, key in _COUNTY_SLUG_MAP.items():
+        if slug in compact or compact in slug:
+            return key
+
+    return "denver"
+
+
 class ColoradoTaxSaleAdapter(ScrapingSource):
     """
     Scraper for Colorado Tax Sale - county-based tax lien auctions.
@@ -157,6 +233,14 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
     INTEREST_RATE_2025 = 14.0
     REDEMPTION_PERIOD_YEARS = 3
 
+    # Rate-limit / overload responses worth retrying, and the longest
+    # Retry-After (seconds) we are willing to honor
+    RETRY_STATUSES = frozenset({429, 503})
+    MAX_RETRY_AFTER = 30
+
+    # Only the table HTML is parsed; don't download these
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
     def __init__(
         self,
         state: str = "CO",
@@ -164,38 +248,28 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
         headless: bool = True,
         timeout: Optional[int] = None,
         credentials: Optional[Dict[str, str]] = None,
+        browser: Optional[Any] = None,
+        include_raw: bool = False,
+        cache_dir: Optional[str] = None,
     ):
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.credentials = credentials
+        # Keep each row's header->cell dict on TaxLien.raw_data (debugging only)
+        self.include_raw = include_raw
+        # Where extracted auction tables are kept for same-day replays (off if None)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.county_slug = self._get_county_slug()
 
     def _get_county_slug(self) -> str:
         """Convert county name to URL slug."""
-        if not self.county:
-            return "denver"  # Default to Denver
-
-        slug = self.county.lower().replace(" ", "")
-        if slug in COLORADO_COUNTIES:
-            return slug
-
-        # Try with space
-        slug_with_space = self.county.lower()
-        if slug_with_space in COLORADO_COUNTIES:
-            return slug_with_space
-
-        # Try fuzzy match
-        for key in COLORADO_COUNTIES:
-            if slug in key.replace(" ", "") or key.replace(" ", "") in slug:
-                return key
-
-        return "denver"
+        return _resolve_county_slug(self.county)
 
     def get_available_counties(self) -> list[str]:
         """Get list of Colorado counties with known tax sale info."""
         known = [info["name"] for info in COLORADO_COUNTIES.values()]
         return sorted(set(known + ADDITIONAL_CO_COUNTIES))
 
-    def get_county_info(self) -> Dict:
+    def get_county_info(self) -> Mapping[str, Any]:
         """Get info about the configured county."""
         return COLORADO_COUNTIES.get(self.county_slug, {})
 
@@ -210,11 +284,7 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
 
     async def _init_browser(self):
         """Initialize Playwright browser with anti-detection settings."""
-        from playwright.async_api import async_playwright
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
+        self._browser = await self._launch_browser(
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--disable-dev-shm-usage",
@@ -227,6 +297,14 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
         await self._context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
         """)
+        await self._context.route("**/*", self._route_request)
+
+    async def _route_request(self, route):
+        """Abort requests for resources the parser never looks at."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def fetch(self, max_records: int = 500, **kwargs) -> LienBatch:
         """
@@ -242,13 +320,18 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
             This platform typically returns 403 without registration.
             For live data, register at the county's tax sale site.
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         liens = []
         county_info = self.get_county_info()
         url = self.get_county_url()
 
         if county_info.get("platform") == "live":
-            print(f"{county_info.get('name', self.county_slug.title())} County uses live in-person auctions.")
-            print("Check county treasurer's website for auction dates and property lists.")
+            logger.info(
+                "%s County uses live in-person auctions. Check county treasurer's website "
+                "for auction dates and property lists.",
+                county_info.get("name", self.county_slug.title()),
+            )
             return LienBatch(
                 liens=[],
                 source_url=url or "",
@@ -257,106 +340,204 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
                 county_filter=self.county or self.county_slug.title()
             )
 
+        # Same-day replay: skip the browser when today's tables are cached
+        cache_path = self._table_cache_path(url)
+        tables = self._load_cached_tables(cache_path)
+        if tables is not None:
+            logger.debug("Using cached auction tables from %s", cache_path)
+            liens = list(islice(self._iter_table_liens(tables), max_records))
+            return LienBatch(
+                liens=liens,
+                source_url=url,
+                scrape_timestamp=date.today(),
+                state_filter=self.state,
+                county_filter=self.county or self.county_slug.title()
+            )
+
         async with self:
             page = await self._context.new_page()
             page.set_default_timeout(self.timeout)
 
             try:
-                print(f"Navigating to {url}...")
-                print(f"Platform: {county_info.get('platform', 'coloradotaxsale')}")
+                logger.debug(
+                    "Navigating to %s (platform: %s)", url, county_info.get("platform", "coloradotaxsale")
+                )
 
-                response = await page.goto(url, wait_until="domcontentloaded")
+                response = await self._goto_with_retry(page, url)
 
                 if response and response.status == 403:
-                    print(f"Access denied (403). Registration required at {url}")
-                    print(f"Colorado Tax Sale requires bidder registration.")
-                    print(f"2025 Interest Rate: {self.INTEREST_RATE_2025}%")
+                    logger.info(
+                        "Access denied (403). Colorado Tax Sale requires bidder registration at %s "
+                        "(2025 interest rate: %s%%)",
+                        url, self.INTEREST_RATE_2025,
+                    )
                 else:
-                    await page.wait_for_timeout(3000)
-                    html = await page.content()
-                    liens = self._parse_auction_page(html)
+                    # Wait for the auction table rather than a fixed sleep
+                    try:
+                        await page.wait_for_selector("table", timeout=3000)
+                    except PlaywrightTimeoutError:
+                        pass
+                    try:
+                        # Let Chromium read the cells from its DOM; no HTML
+                        # round trip through Python
+                        tables = await page.evaluate(_TABLE_TEXT_JS)
+                        rows = self._iter_table_liens(tables)
+                    except Exception as e:
+                        logger.debug("In-page table extraction failed (%s); parsing HTML instead", e)
+                        rows = self._iter_auction_liens(await page.content())
+                    # Stop parsing once max_records liens have been built
+                    liens = list(islice(rows, max_records))
 
                 if liens:
-                    print(f"Found {len(liens)} liens")
+                    logger.info("Found %d liens in %s", len(liens), url)
+                    if tables is not None:
+                        self._save_cached_tables(cache_path, tables)
                 else:
-                    print(f"No public data available for {self.county_slug.title()} County.")
-                    print(f"Register at {url} to access auction data.")
+                    logger.info(
+                        "No public data available for %s County. Register at %s to access auction data.",
+                        self.county_slug.title(), url,
+                    )
 
             except Exception as e:
-                print(f"Colorado scraping error: {e}")
-                print(f"Note: Register at {url} to access auction data.")
+                logger.warning(
+                    "Colorado scraping error: %s (register at %s to access auction data)", e, url
+                )
 
             finally:
                 await page.close()
 
         return LienBatch(
-            liens=liens[:max_records],
+            liens=liens,
             source_url=url,
             scrape_timestamp=date.today(),
             state_filter=self.state,
             county_filter=self.county or self.county_slug.title()
         )
 
+    async def _goto_with_retry(self, page, url: str, attempts: int = 3):
+        """
+        Navigate to url, retrying transient failures with exponential backoff.
+
+        Timeouts and network errors are retried after 1s, 2s, ...; 429/503
+        responses are retried after their Retry-After delay (capped). Other
+        responses, including 403, are returned as-is.
+
+        Args:
+            page: Playwright page
+            url: URL to open
+            attempts: Total number of tries
+
+        Returns:
+            The navigation response of the last attempt
+
+        Raises:
+            playwright.async_api.Error: If every attempt failed
+        """
+        from playwright.async_api import Error as PlaywrightError
+
+        for attempt in range(attempts):
+            delay = 2 ** attempt
+            try:
+                response = await page.goto(url, wait_until="domcontentloaded")
+            except PlaywrightError as e:
+                if attempt == attempts - 1:
+                    raise
+                logger.debug("Navigation to %s failed (%s); retrying in %ds", url, e, delay)
+            else:
+                if response is None or response.status not in self.RETRY_STATUSES:
+                    return response
+                if attempt == attempts - 1:
+                    return response
+                retry_after = response.headers.get("retry-after", "")
+                if retry_after.isdigit():
+                    delay = min(int(retry_after), self.MAX_RETRY_AFTER)
+                logger.debug("%s returned %d; retrying in %ds", url, response.status, delay)
+            await asyncio.sleep(delay)
+
+    def _table_cache_path(self, url: str) -> Optional[Path]:
+        """Cache file for today's tables at url, or None when caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(f"{url}|{date.today().isoformat()}".encode()).hexdigest()
+        return self.cache_dir / f"co_{key}.json.gz"
+
+    @staticmethod
+    def _load_cached_tables(path: Optional[Path]) -> Optional[list]:
+        """Read cached tables (rows of cell texts), or None on a miss."""
+        if path is None or not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning("Ignoring unreadable table cache %s: %s", path, e)
+            return None
+
+    @staticmethod
+    def _save_cached_tables(path: Optional[Path], tables: list) -> None:
+        """Write extracted tables to the cache (best effort)."""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                json.dump(tables, f)
+        except OSError as e:
+            logger.warning("Could not write table cache %s: %s", path, e)
+
     def _parse_auction_page(self, html: str) -> list[TaxLien]:
         """Parse Colorado Tax Sale auction page into TaxLien records."""
-        soup = BeautifulSoup(html, "lxml")
-        liens = []
+        return list(self._iter_auction_liens(html))
 
-        # Look for property tables
-        tables = soup.find_all("table")
+    def _iter_auction_liens(self, html: str) -> Iterator[TaxLien]:
+        """Yield TaxLien records from a Colorado auction page, row by row."""
+        yield from self._iter_table_liens(iter_table_rows(html))
 
-        for table in tables:
-            rows = table.find_all("tr")
+    def _iter_table_liens(self, tables: Iterable[Iterable[list[str]]]) -> Iterator[TaxLien]:
+        """Yield TaxLien records from tables given as rows of cell texts."""
+        for rows in tables:
             headers = []
+            field_keys = {}
 
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                cell_texts = [c.get_text(strip=True) for c in cells]
-
+            for cell_texts in rows:
                 # Detect header row
-                if any("parcel" in t.lower() or "schedule" in t.lower() or "amount" in t.lower() for t in cell_texts):
+                # One lower() and a few C-level substring scans per row; the
+                # NUL separator keeps a marker from spanning two cells
+                row_text = "\0".join(cell_texts).lower()
+                if any(marker in row_text for marker in _HEADER_MARKERS):
                     headers = [t.lower() for t in cell_texts]
+                    field_keys = index_headers(headers, _FIELD_KEYWORDS)
                     continue
 
-                if len(cells) < 3 or not headers:
+                if len(cell_texts) < 3 or not headers:
                     continue
 
-                try:
-                    data = dict(zip(headers, cell_texts))
+                data = dict(zip(headers, cell_texts))
 
-                    parcel_id = self._find_field(data, ["parcel", "schedule", "account", "pin"])
-                    if not parcel_id:
-                        continue
+                parcel_id = lookup(data, field_keys["parcel_id"])
+                if not parcel_id:
+                    continue
 
+                try:
                     lien = TaxLien(
                         state="CO",
                         county=self.county or self.county_slug.title(),
                         parcel_id=parcel_id,
-                        address=self._find_field(data, ["address", "location", "situs", "property"]),
+                        address=lookup(data, field_keys["address"]),
                         assessed_value=self._parse_currency(
-                            self._find_field(data, ["assessed", "value", "actual"])
+                            lookup(data, field_keys["assessed_value"])
                         ),
                         face_amount=self._parse_currency(
-                            self._find_field(data, ["amount", "due", "total", "tax", "delinquent"])
+                            lookup(data, field_keys["face_amount"])
                         ) or 0.0,
                         interest_rate_bid=self.INTEREST_RATE_2025,
                         auction_date=None,
                         source_platform=SourcePlatform.REALAUCTION,
-                        raw_data=data
+                        raw_data=data if self.include_raw else None
                     )
-                    liens.append(lien)
                 except Exception:
                     continue
-
-        return liens
-
-    def _find_field(self, data: dict, keywords: list) -> Optional[str]:
-        """Find a field value by keyword matching."""
-        for key, value in data.items():
-            for keyword in keywords:
-                if keyword in key.lower():
-                    return value
-        return None
+                yield lien
 
     @staticmethod
     def _parse_currency(value: Optional[str]) -> Optional[float]:
@@ -364,12 +545,103 @@ class ColoradoTaxSaleAdapter(ScrapingSource):
         if not value:
             return None
         try:
-            cleaned = re.sub(r"[$,\s]", "", value)
+            cleaned = CURRENCY_CHARS_RE.sub("", value)
             return float(cleaned) if cleaned else None
         except (ValueError, TypeError):
             return None
 
     @classmethod
-    def get_all_counties(cls) -> Dict[str, Dict]:
-        """Get all known Colorado counties with tax sale info."""
-        return COLORADO_COUNTIES.copy()
+    async def fetch_many(
+        cls,
+        counties: list[str],
+        max_concurrency: int = 5,
+        max_records: int = 500,
+        headless: bool = True,
+    ) -> list[LienBatch]:
+        """
+        Fetch several counties concurrently on one browser.
+
+        A Chromium is launched for the call and closed before returning;
+        each county gets its own adapter (and browser context) on it, with
+        at most max_concurrency pages open at once.
+
+        Args:
+            counties: County names to fetch
+            max_concurrency: Maximum number of counties scraped at once
+            max_records: Maximum number of records per county
+            headless: Whether to run browser in headless mode
+
+        Returns:
+            One LienBatch per county, in input order (empty for failed counties)
+        """
+        from playwright.async_api import async_playwright
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=headless, args=list(cls.launch_args))
+
+            async def _fetch_one(county: str) -> LienBatch:
+                async with semaphore:
+                    adapter = cls(county=county, headless=headless, browser=browser)
+                    return await adapter.fetch(max_records=max_records)
+
+            try:
+                results = await asyncio.gather(
+                    *(_fetch_one(county) for county in counties), return_exceptions=True
+                )
+            finally:
+                await browser.close()
+
+        batches = []
+        for county, result in zip(counties, results):
+            # BaseException: a cancelled county task comes back as CancelledError
+            if isinstance(result, BaseException):
+                logger.warning("Colorado scraping error (%s): %r", county, result)
+                result = LienBatch(
+                    liens=[],
+                    scrape_timestamp=date.today(),
+                    state_filter="CO",
+                    county_filter=county,
+                )
+            batches.append(result)
+        return batches
+
+    @classmethod
+    def parse_many_htmls(
+        cls,
+        pages: list[tuple[Optional[str], str]],
+        max_workers: Optional[int] = None,
+        include_raw: bool = False,
+    ) -> list[list[TaxLien]]:
+        """
+        Parse several already-fetched auction pages in worker processes.
+
+        Parsing is pure CPU work on independent strings, so pages are spread
+        across processes instead of contending for the GIL.
+
+        Args:
+            pages: (county, html) pairs, one per auction page
+            max_workers: Worker processes (defaults to the CPU count)
+            include_raw: Keep each row's header->cell dict on raw_data
+
+        Returns:
+            Parsed liens per page, in input order
+        """
+        if len(pages) < 2:
+            return [_parse_page(county, html, include_raw) for county, html in pages]
+
+        counties, htmls = zip(*pages)
+        workers = min(len(pages), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_parse_page, counties, htmls, [include_raw] * len(pages)))
+
+    @classmethod
+    def get_all_counties(cls) -> Mapping[str, Mapping[str, Any]]:
+        """Get all known Colorado counties with tax sale info (read-only)."""
+        return COLORADO_COUNTIES
+
+
+def _parse_page(county: Optional[str], html: str, include_raw: bool) -> list[TaxLien]:
+    """Parse one auction page (module-level so worker processes can pickle it)."""
+    return ColoradoTaxSaleAdapter(county=county, include_raw=include_raw)._parse_auction_page(html)
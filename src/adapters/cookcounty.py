@@ -2,12 +2,19 @@
 
 import re
 from datetime import date
-from typing import Optional, Dict
-
-from bs4 import BeautifulSoup
+from typing import Any, Optional, Dict
 
+from ._html import iter_table_rows, parse_document
 from .base import ScrapingSource
 from ..models import TaxLien, LienBatch, SourcePlatform
+from ..utils.parsing import CURRENCY_CHARS_RE
+
+
+# Sale-date formats on the treasurer page ("December 9, 2025", "12/9/2025")
+_SALE_DATE_PATTERNS = (
+    re.compile(r"(\w+ \d+, \d{4})"),
+    re.compile(r"(\d{1,2}/\d{1,2}/\d{4})"),
+)
 
 
 # Illinois county info
@@ -88,8 +95,9 @@ class CookCountyAdapter(ScrapingSource):
         headless: bool = True,
         timeout: Optional[int] = None,
         credentials: Optional[Dict[str, str]] = None,
+        browser: Optional[Any] = None,
     ):
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.credentials = credentials
         self.county_slug = self._get_county_slug()
 
@@ -124,16 +132,7 @@ class CookCountyAdapter(ScrapingSource):
 
     async def _init_browser(self):
         """Initialize Playwright browser with anti-detection settings."""
-        from playwright.async_api import async_playwright
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-            ]
-        )
+        self._browser = await self._launch_browser()
         self._context = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -215,27 +214,20 @@ class CookCountyAdapter(ScrapingSource):
 
     def _parse_auction_page(self, html: str) -> list[TaxLien]:
         """Parse Cook County Tax Sale page into TaxLien records."""
-        soup = BeautifulSoup(html, "lxml")
         liens = []
 
         # Look for property tables
-        tables = soup.find_all("table")
-
-        for table in tables:
-            rows = table.find_all("tr")
+        for rows in iter_table_rows(html):
             headers = []
 
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                cell_texts = [c.get_text(strip=True) for c in cells]
-
+            for cell_texts in rows:
                 # Detect header row - Cook County uses PIN
                 header_keywords = ["pin", "parcel", "address", "amount", "township", "volume"]
                 if any(any(kw in t.lower() for kw in header_keywords) for t in cell_texts):
                     headers = [t.lower() for t in cell_texts]
                     continue
 
-                if len(cells) < 3 or not headers:
+                if len(cell_texts) < 3 or not headers:
                     continue
 
                 try:
@@ -273,31 +265,33 @@ class CookCountyAdapter(ScrapingSource):
 
     def _parse_treasurer_page(self, html: str) -> Dict:
         """Parse treasurer page for sale schedule and info."""
-        soup = BeautifulSoup(html, "lxml")
         info = {}
 
+        # Only the page text is needed; get_text() skipped script/style/template
+        # bodies, so strip those too
+        doc = parse_document(html, strip=("script", "style", "template"))
+        if doc is None:
+            return info
+
         # Look for sale dates and schedule
-        text = soup.get_text()
+        text = doc.text_content()
 
-        # Try to find sale date
-        date_patterns = [
-            r"(\w+ \d+, \d{4})",
-            r"(\d{1,2}/\d{1,2}/\d{4})",
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match and any(kw in text[max(0, match.start()-50):match.end()+50].lower()
-                            for kw in ["sale", "auction", "begin"]):
+        text_lower = text.lower()
+
+        # Try to find sale date (keyword within 50 chars; bounded find, no slice)
+        for pattern in _SALE_DATE_PATTERNS:
+            match = pattern.search(text)
+            if match and any(
+                text_lower.find(kw, max(0, match.start() - 50), match.end() + 50) != -1
+                for kw in ("sale", "auction", "begin")
+            ):
                 info["sale_date"] = match.group(1)
                 break
 
         # Look for townships schedule
-        townships = self.get_townships()
-        for township in townships:
-            if township.lower() in text.lower():
-                if "schedule" not in info:
-                    info["schedule"] = []
-                info["schedule"].append(township)
+        schedule = [t for t in self.get_townships() if t.lower() in text_lower]
+        if schedule:
+            info["schedule"] = schedule
 
         return info
 
@@ -315,7 +309,7 @@ class CookCountyAdapter(ScrapingSource):
         if not value:
             return None
         try:
-            cleaned = re.sub(r"[$,\s]", "", value)
+            cleaned = CURRENCY_CHARS_RE.sub("", value)
             return float(cleaned) if cleaned else None
         except (ValueError, TypeError):
             return None
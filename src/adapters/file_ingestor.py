@@ -6,13 +6,31 @@ from datetime import date
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
-from thefuzz import fuzz, process
+from rapidfuzz import fuzz, process, utils
 
 from .base import FileSource
 from ..models import TaxLien, LienBatch, SourcePlatform
 
 
+# Currency symbols, thousands separators, percent signs and whitespace
+_NUMERIC_CHARS_RE = re.compile(r"[$,%\s]")
+
+# Leading signatures of the Excel containers: XLSX is a zip, XLS an OLE2 file
+_XLSX_MAGIC = b"PK\x03\x04"
+_XLS_MAGIC = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+
+
+def _sniff(content: bytes) -> str:
+    """Detect an upload's format from its leading bytes: 'xlsx', 'xls' or 'csv'."""
+    if content[:4] == _XLSX_MAGIC:
+        return "xlsx"
+    if content[:8] == _XLS_MAGIC:
+        return "xls"
+    return "csv"
+
+
 class FileIngestorAdapter(FileSource):
     """
     Adapter for ingesting tax lien data from CSV/Excel files.
@@ -103,6 +121,19 @@ class FileIngestorAdapter(FileSource):
         ],
     }
 
+    # Lowercased candidates per target field, for exact-match lookups
+    _CANDIDATE_SETS = {
+        target_field: frozenset(c.lower() for c in candidates)
+        for target_field, candidates in COLUMN_CANDIDATES.items()
+    }
+
+    # All candidates, pre-processed for scoring, in one flat list, with the
+    # offset where each target's run starts
+    _FLAT_CANDIDATES = [
+        utils.default_process(c) for candidates in COLUMN_CANDIDATES.values() for c in candidates
+    ]
+    _CANDIDATE_OFFSETS = np.cumsum([0] + [len(c) for c in COLUMN_CANDIDATES.values()])[:-1]
+
     # Minimum fuzzy match score to consider a match
     FUZZY_THRESHOLD = 70
 
@@ -163,12 +194,10 @@ class FileIngestorAdapter(FileSource):
         if self.file_content:
             # From uploaded bytes
             buffer = io.BytesIO(self.file_content)
-            # Detect format from magic bytes or try both
-            try:
-                return pd.read_excel(buffer)
-            except Exception:
-                buffer.seek(0)
+            # Detect format from magic bytes
+            if _sniff(self.file_content) == "csv":
                 return pd.read_csv(buffer)
+            return pd.read_excel(buffer)
 
         elif self.file_path:
             # From file path
@@ -198,32 +227,26 @@ class FileIngestorAdapter(FileSource):
         """
         mappings = {}
         used_columns = set()
+        fuzzy_scores = self._fuzzy_scores(columns)
 
         # For each target field, find the best matching source column
-        for target_field, candidates in self.COLUMN_CANDIDATES.items():
+        for target_index, target_field in enumerate(self.COLUMN_CANDIDATES):
             best_match = None
             best_score = 0
 
-            for col in columns:
+            for col, col_scores in zip(columns, fuzzy_scores):
                 if col in used_columns:
                     continue
 
-                col_lower = col.lower().strip()
-
                 # Try exact match first
-                if col_lower in [c.lower() for c in candidates]:
+                if col.lower().strip() in self._CANDIDATE_SETS[target_field]:
                     best_match = col
                     best_score = 100
                     break
 
-                # Try fuzzy matching
-                result = process.extractOne(
-                    col_lower,
-                    candidates,
-                    scorer=fuzz.ratio
-                )
-                if result and result[1] > best_score:
-                    best_score = result[1]
+                # Fall back to the fuzzy score
+                if col_scores[target_index] > best_score:
+                    best_score = col_scores[target_index]
                     best_match = col
 
             if best_match and best_score >= self.FUZZY_THRESHOLD:
@@ -232,6 +255,30 @@ class FileIngestorAdapter(FileSource):
 
         return mappings
 
+    @classmethod
+    def _fuzzy_scores(cls, columns: list[str]) -> list[list[int]]:
+        """
+        Score every column against every target field.
+
+        All column/candidate pairs go through a single rapidfuzz cdist call;
+        a target's score is the best over its candidates, rounded as
+        thefuzz-style extractOne scores are.
+
+        Args:
+            columns: List of column names from the file
+
+        Returns:
+            One row of scores per column, in COLUMN_CANDIDATES target order
+        """
+        scores = process.cdist(
+            [utils.default_process(col) for col in columns],
+            cls._FLAT_CANDIDATES,
+            scorer=fuzz.ratio,
+            dtype=np.float64
+        )
+        best = np.maximum.reduceat(scores, cls._CANDIDATE_OFFSETS, axis=1).round()
+        return best.astype(int).tolist()
+
     def get_detected_mappings(self) -> dict[str, str]:
         """Return the detected column mappings for UI display."""
         return self._detected_mappings.copy()
@@ -243,58 +290,82 @@ class FileIngestorAdapter(FileSource):
 
     def _transform_dataframe(self, df: pd.DataFrame) -> list[TaxLien]:
         """Transform DataFrame rows into TaxLien records."""
-        liens = []
         reverse_map = {v: k for k, v in self._detected_mappings.items()}
 
-        for _, row in df.iterrows():
-            try:
-                raw_data = row.to_dict()
-
-                # Extract and clean values
-                parcel_id = self._get_mapped_value(row, reverse_map, "parcel_id")
-                if not parcel_id:
-                    continue  # Skip rows without parcel ID
-
-                lien = TaxLien(
-                    state=self.state,
-                    county=self._get_mapped_value(row, reverse_map, "county") or self.county or "Unknown",
-                    parcel_id=str(parcel_id).strip(),
-                    address=self._get_mapped_value(row, reverse_map, "address"),
-                    assessed_value=self._parse_numeric(
-                        self._get_mapped_value(row, reverse_map, "assessed_value")
-                    ),
-                    face_amount=self._parse_numeric(
-                        self._get_mapped_value(row, reverse_map, "face_amount")
-                    ) or 0.0,
-                    interest_rate_bid=self._parse_numeric(
-                        self._get_mapped_value(row, reverse_map, "interest_rate_bid")
-                    ),
-                    auction_date=self._parse_date(
-                        self._get_mapped_value(row, reverse_map, "auction_date")
-                    ),
-                    source_platform=self.platform,
-                    raw_data=raw_data
-                )
-                liens.append(lien)
-
-            except Exception:
-                continue  # Skip malformed rows
-
-        return liens
-
-    def _get_mapped_value(
-        self,
-        row: pd.Series,
-        reverse_map: dict,
-        target_field: str
-    ) -> Optional[str]:
-        """Get value from row using the detected mapping."""
-        source_col = reverse_map.get(target_field)
-        if source_col and source_col in row.index:
-            val = row[source_col]
-            if pd.notna(val):
-                return str(val)
-        return None
+        def column(target_field: str) -> list[Optional[str]]:
+            source_col = reverse_map.get(target_field)
+            if source_col and source_col in df.columns:
+                return self._column_strings(df[source_col])
+            return [None] * len(df)
+
+        # Clean and parse each mapped column in one pass
+        parcel_ids = column("parcel_id")
+        counties = column("county")
+        addresses = column("address")
+        assessed_values = self._parse_numeric_column(column("assessed_value"))
+        face_amounts = self._parse_numeric_column(column("face_amount"))
+        interest_rates = self._parse_numeric_column(column("interest_rate_bid"))
+        auction_dates = self._parse_date_column(column("auction_date"))
+        raw_rows = df.to_dict(orient="records")
+
+        default_county = self.county or "Unknown"
+        return TaxLien.from_records([
+            {
+                "state": self.state,
+                "county": county or default_county,
+                "parcel_id": parcel_id.strip(),
+                "address": address,
+                "assessed_value": assessed,
+                "face_amount": face or 0.0,
+                "interest_rate_bid": rate,
+                "auction_date": auction_date,
+                "source_platform": self.platform,
+                "raw_data": raw_data,
+            }
+            for parcel_id, county, address, assessed, face, rate, auction_date, raw_data in zip(
+                parcel_ids, counties, addresses, assessed_values, face_amounts,
+                interest_rates, auction_dates, raw_rows
+            )
+            if parcel_id  # Skip rows without parcel ID
+        ])
+
+    @staticmethod
+    def _column_strings(col: pd.Series) -> list[Optional[str]]:
+        """Stringify a column's values, with None for missing cells."""
+        return (
+            col.map(str, na_action="ignore")
+            .astype(object)
+            .where(col.notna(), None)
+            .tolist()
+        )
+
+    @classmethod
+    def _parse_numeric_column(cls, values: list[Optional[str]]) -> list[Optional[float]]:
+        """Column-wise `_parse_numeric`: strip symbols in bulk, then convert."""
+        cleaned = (
+            pd.Series(values, dtype=object)
+            .str.replace(_NUMERIC_CHARS_RE, "", regex=True)
+            .tolist()
+        )
+        # pd.to_numeric is not correctly rounded for long decimals, so the
+        # final conversion stays with float()
+        return [cls._to_float(v) for v in cleaned]
+
+    @staticmethod
+    def _to_float(cleaned) -> Optional[float]:
+        """float() of an already-cleaned value; None if empty or invalid."""
+        if not isinstance(cleaned, str) or not cleaned:
+            return None
+        try:
+            return float(cleaned)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _parse_date_column(cls, values: list[Optional[str]]) -> list[Optional[date]]:
+        """Column-wise `_parse_date`, parsing each distinct value once."""
+        parsed = {v: cls._parse_date(v) for v in set(values)}
+        return [parsed[v] for v in values]
 
     @staticmethod
     def _parse_numeric(value: Optional[str]) -> Optional[float]:
@@ -303,7 +374,7 @@ class FileIngestorAdapter(FileSource):
             return None
         try:
             # Remove currency symbols, commas, whitespace, percent signs
-            cleaned = re.sub(r"[$,%\s]", "", str(value))
+            cleaned = _NUMERIC_CHARS_RE.sub("", str(value))
             return float(cleaned) if cleaned else None
         except (ValueError, TypeError):
             return None
@@ -346,11 +417,10 @@ class ColumnMappingHelper:
             Tuple of (column names, preview rows as dicts)
         """
         buffer = io.BytesIO(file_content)
-        try:
-            df = pd.read_excel(buffer, nrows=n_rows)
-        except Exception:
-            buffer.seek(0)
+        if _sniff(file_content) == "csv":
             df = pd.read_csv(buffer, nrows=n_rows)
+        else:
+            df = pd.read_excel(buffer, nrows=n_rows)
 
         columns = df.columns.tolist()
         preview = df.head(n_rows).to_dict(orient="records")
@@ -367,26 +437,26 @@ class ColumnMappingHelper:
         suggestions = {}
         used_targets = set()
 
-        for col in columns:
+        fuzzy_scores = FileIngestorAdapter._fuzzy_scores(columns)
+
+        for col, col_scores in zip(columns, fuzzy_scores):
             col_lower = col.lower().strip()
-            best_match = None
             best_score = 0
             best_target = None
 
-            for target_field, candidates in FileIngestorAdapter.COLUMN_CANDIDATES.items():
+            for target_index, target_field in enumerate(FileIngestorAdapter.COLUMN_CANDIDATES):
                 if target_field in used_targets:
                     continue
 
                 # Exact match
-                if col_lower in [c.lower() for c in candidates]:
+                if col_lower in FileIngestorAdapter._CANDIDATE_SETS[target_field]:
                     best_target = target_field
                     best_score = 100
                     break
 
                 # Fuzzy match
-                result = process.extractOne(col_lower, candidates, scorer=fuzz.ratio)
-                if result and result[1] > best_score:
-                    best_score = result[1]
+                if col_scores[target_index] > best_score:
+                    best_score = col_scores[target_index]
                     best_target = target_field
 
             if best_target and best_score >= 50:  # Lower threshold for suggestions
@@ -101,8 +101,9 @@ class GovEaseAdapter(ScrapingSource):
         headless: bool = True,
         timeout: Optional[int] = None,
         credentials: Optional[Dict[str, str]] = None,
+        browser: Optional[Any] = None,
     ):
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.credentials = credentials
         self.state_config = GOVEASE_STATES.get(state.upper(), {})
 
@@ -112,11 +113,7 @@ class GovEaseAdapter(ScrapingSource):
 
     async def _init_browser(self):
         """Initialize Playwright browser with anti-detection settings."""
-        from playwright.async_api import async_playwright
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
+        self._browser = await self._launch_browser(
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--disable-dev-shm-usage",
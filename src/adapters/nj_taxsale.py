@@ -2,7 +2,7 @@
 
 import re
 from datetime import date
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 
 from bs4 import BeautifulSoup
 
@@ -81,8 +81,9 @@ class NJTaxSaleAdapter(ScrapingSource):
         headless: bool = True,
         timeout: Optional[int] = None,
         credentials: Optional[Dict[str, str]] = None,
+        browser: Optional[Any] = None,
     ):
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.municipality = municipality
         self.credentials = credentials
         self.municipality_slug = self._get_municipality_slug()
@@ -124,11 +125,7 @@ class NJTaxSaleAdapter(ScrapingSource):
 
     async def _init_browser(self):
         """Initialize Playwright browser with anti-detection settings."""
-        from playwright.async_api import async_playwright
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
+        self._browser = await self._launch_browser(
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--disable-dev-shm-usage",
@@ -2,7 +2,7 @@
 
 import re
 from datetime import date
-from typing import Optional
+from typing import Any, Optional
 
 from bs4 import BeautifulSoup
 
@@ -73,7 +73,8 @@ class RealAuctionAdapter(ScrapingSource):
         county: Optional[str] = None,
         headless: bool = True,
         timeout: Optional[int] = None,
-        use_demo: bool = False
+        use_demo: bool = False,
+        browser: Optional[Any] = None
     ):
         """
         Initialize RealAuction scraper.
@@ -84,8 +85,9 @@ class RealAuctionAdapter(ScrapingSource):
             headless: Run browser headlessly
             timeout: Request timeout in ms
             use_demo: Use demo site instead of real county site
+            browser: Shared Playwright browser to open contexts on
         """
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.use_demo = use_demo
         self.base_url = self._get_site_url()
 
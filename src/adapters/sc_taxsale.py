@@ -2,7 +2,7 @@
 
 import re
 from datetime import date
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 
 from bs4 import BeautifulSoup
 
@@ -147,8 +147,9 @@ class SCTaxSaleAdapter(ScrapingSource):
         county: Optional[str] = None,
         headless: bool = True,
         timeout: Optional[int] = None,
+        browser: Optional[Any] = None,
     ):
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.county_slug = self._get_county_slug()
 
     def _get_county_slug(self) -> str:
@@ -182,11 +183,7 @@ class SCTaxSaleAdapter(ScrapingSource):
 
     async def _init_browser(self):
         """Initialize Playwright browser."""
-        from playwright.async_api import async_playwright
-
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
+        self._browser = await self._launch_browser(
             args=["--disable-blink-features=AutomationControlled"]
         )
         self._context = await self._browser.new_context(
@@ -2,7 +2,7 @@
 
 import re
 from datetime import date
-from typing import Optional
+from typing import Any, Optional
 
 from bs4 import BeautifulSoup
 
@@ -68,7 +68,8 @@ class ZeusAdapter(ScrapingSource):
         county: Optional[str] = None,
         headless: bool = True,
         timeout: Optional[int] = None,
-        credentials: Optional[dict] = None
+        credentials: Optional[dict] = None,
+        browser: Optional[Any] = None
     ):
         """
         Initialize Zeus Auction scraper.
@@ -79,8 +80,9 @@ class ZeusAdapter(ScrapingSource):
             headless: Run browser headlessly
             timeout: Request timeout in ms
             credentials: Optional dict with 'username' and 'password'
+            browser: Shared Playwright browser to open contexts on
         """
-        super().__init__(state, county, headless, timeout)
+        super().__init__(state, county, headless, timeout, browser)
         self.credentials = credentials
 
     def get_available_counties(self) -> list[str]:
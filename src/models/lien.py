@@ -1,10 +1,17 @@
 """Pydantic models for normalized tax lien data."""
 
+import json
 from datetime import date
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from operator import attrgetter
+from pathlib import Path
+from typing import Optional, Union
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, computed_field, field_validator
 
 
 SUPPORTED_STATES = ["IL", "FL", "AZ", "NJ", "IN", "CO", "IA", "MS", "AL", "SC"]
@@ -90,6 +97,28 @@ class TaxLien(BaseModel):
         """Normalize county name to title case."""
         return v.strip().title()
 
+    @classmethod
+    def from_records(cls, records: list[dict]) -> list["TaxLien"]:
+        """
+        Validate many raw records in a single pydantic-core call.
+
+        Records that fail validation are dropped, matching the per-row
+        try/except construction used by the adapters.
+
+        Args:
+            records: Field dicts, one per lien
+
+        Returns:
+            TaxLien instances for the valid records, in input order
+        """
+        try:
+            return _TAX_LIEN_LIST.validate_python(records)
+        except ValidationError as e:
+            bad = {err["loc"][0] for err in e.errors()}
+            return _TAX_LIEN_LIST.validate_python(
+                [r for i, r in enumerate(records) if i not in bad]
+            )
+
     @computed_field
     @property
     def lien_to_value_ratio(self) -> Optional[float]:
@@ -116,6 +145,26 @@ class TaxLien(BaseModel):
         return None
 
 
+# Built once; validating a whole list skips the per-row __init__ dispatch
+_TAX_LIEN_LIST = TypeAdapter(list[TaxLien])
+
+# Stored (non-computed) TaxLien fields and their parquet column types
+_LIEN_ARROW_SCHEMA = pa.schema([
+    ("state", pa.string()),
+    ("county", pa.string()),
+    ("parcel_id", pa.string()),
+    ("address", pa.string()),
+    ("assessed_value", pa.float64()),
+    ("face_amount", pa.float64()),
+    ("interest_rate_bid", pa.float64()),
+    ("auction_date", pa.date32()),
+    ("source_platform", pa.string()),
+    ("raw_data", pa.string()),
+])
+_LIEN_COLUMNS = tuple(_LIEN_ARROW_SCHEMA.names)
+_LIEN_COLUMN_GETTER = attrgetter(*_LIEN_COLUMNS)
+
+
 class LienBatch(BaseModel):
     """A batch of tax liens from a single scrape/upload operation."""
 
@@ -130,10 +179,43 @@ class LienBatch(BaseModel):
         """Number of liens in the batch."""
         return len(self.liens)
 
-    @property
+    @cached_property
+    def face_amounts(self) -> np.ndarray:
+        """Face amounts as a float64 column, in lien order."""
+        return np.fromiter(
+            (lien.face_amount for lien in self.liens),
+            dtype=np.float64,
+            count=len(self.liens),
+        )
+
+    @cached_property
+    def assessed_values(self) -> np.ndarray:
+        """Assessed values as a float64 column (NaN where unknown)."""
+        return np.fromiter(
+            (np.nan if lien.assessed_value is None else lien.assessed_value for lien in self.liens),
+            dtype=np.float64,
+            count=len(self.liens),
+        )
+
+    @cached_property
+    def ltv(self) -> np.ndarray:
+        """LTV ratios as a float32 column (NaN where unknown)."""
+        ltv = np.full(len(self.liens), np.nan, dtype=np.float32)
+        assessed = self.assessed_values
+        known = assessed > 0
+        # Same rounding as TaxLien.lien_to_value_ratio
+        ltv[known] = np.round(self.face_amounts[known] / assessed[known] * 100, 2)
+        return ltv
+
+    @cached_property
     def total_face_amount(self) -> float:
-        """Sum of all face amounts in batch."""
-        return sum(lien.face_amount for lien in self.liens)
+        """Sum of all face amounts in batch (computed once per batch)."""
+        return float(self.face_amounts.sum())
+
+    @cached_property
+    def counties(self) -> frozenset[str]:
+        """Distinct county names in batch (computed once per batch)."""
+        return frozenset(lien.county for lien in self.liens)
 
     @property
     def avg_ltv(self) -> Optional[float]:
@@ -143,6 +225,77 @@ class LienBatch(BaseModel):
             return round(sum(ltvs) / len(ltvs), 2)
         return None
 
+    def to_arrow(self) -> pa.Table:
+        """
+        Build a columnar Arrow table of the stored lien fields.
+
+        Columns are gathered in one pass over the liens; computed fields are
+        left out, raw_data is JSON-encoded, and batch metadata goes in the
+        schema metadata.
+
+        Returns:
+            pyarrow.Table with one row per lien
+        """
+        columns = list(zip(*map(_LIEN_COLUMN_GETTER, self.liens))) or [()] * len(_LIEN_COLUMNS)
+        data = dict(zip(_LIEN_COLUMNS, columns))
+        data["source_platform"] = [p.value for p in data["source_platform"]]
+        # Free-form scraper payloads don't have a fixed parquet schema; values
+        # JSON can't hold (dates, Timestamps, Decimals) are stored as str()
+        data["raw_data"] = [
+            None if r is None else json.dumps(r, default=str) for r in data["raw_data"]
+        ]
+
+        arrays = [pa.array(data[name], type=_LIEN_ARROW_SCHEMA.field(name).type) for name in _LIEN_COLUMNS]
+        return pa.Table.from_arrays(arrays, schema=_LIEN_ARROW_SCHEMA).replace_schema_metadata({
+            "source_url": self.source_url or "",
+            "scrape_timestamp": self.scrape_timestamp.isoformat() if self.scrape_timestamp else "",
+            "state_filter": self.state_filter or "",
+            "county_filter": self.county_filter or "",
+        })
+
+    def to_parquet(self, path: Union[str, Path], compression: str = "zstd") -> None:
+        """
+        Write the batch to a parquet file (see to_arrow for the layout).
+
+        Args:
+            path: Destination file; parent directories are created
+            compression: Parquet codec
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(self.to_arrow(), path, compression=compression)
+
+    @classmethod
+    def from_parquet(cls, path: Union[str, Path]) -> "LienBatch":
+        """
+        Read a batch written by to_parquet.
+
+        Args:
+            path: Parquet file to read
+
+        Returns:
+            LienBatch with the stored liens (re-validated) and metadata
+
+        Raises:
+            ValidationError: If any stored row no longer validates (e.g. a
+                stale cache written under an older model)
+        """
+        table = pq.read_table(path)
+        meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+
+        rows = table.to_pylist()
+        for row in rows:
+            if row.get("raw_data") is not None:
+                row["raw_data"] = json.loads(row["raw_data"])
+
+        return cls(
+            liens=_TAX_LIEN_LIST.validate_python(rows),
+            source_url=meta.get("source_url") or None,
+            scrape_timestamp=date.fromisoformat(meta["scrape_timestamp"]) if meta.get("scrape_timestamp") else None,
+            state_filter=meta.get("state_filter") or None,
+            county_filter=meta.get("county_filter") or None,
+        )
+
     def filter_by_ltv(self, max_ltv: float) -> "LienBatch":
         """Return new batch with only liens below max LTV threshold."""
         filtered = [
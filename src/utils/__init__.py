@@ -1,5 +1,14 @@
 """Utility functions for Tax Lien Terminal."""
 
 from .parsing import parse_currency, parse_percentage, clean_parcel_id
+from .event_loop import get_event_loop, run_sync
+from .filters import range_mask
 
-__all__ = ["parse_currency", "parse_percentage", "clean_parcel_id"]
+__all__ = [
+    "parse_currency",
+    "parse_percentage",
+    "clean_parcel_id",
+    "get_event_loop",
+    "run_sync",
+    "range_mask",
+]
@@ -0,0 +1,52 @@
+"""Shared asyncio event loop for running adapter coroutines from sync code."""
+
+import asyncio
+import threading
+from typing import Coroutine, Optional, TypeVar
+
+import nest_asyncio
+
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.RLock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop, creating it on first use.
+
+    Streamlit re-executes the app script on every rerun, so a loop created
+    there would be rebuilt (and torn down) on each call. Keeping it at module
+    level lets loop-bound resources such as Playwright browsers be reused.
+    If the loop has been closed, a fresh one replaces it.
+
+    Returns:
+        The shared event loop (patched with nest_asyncio for re-entrancy)
+    """
+    global _loop
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            nest_asyncio.apply(_loop)
+        return _loop
+
+
+def run_sync(coro: Coroutine[object, object, T]) -> T:
+    """
+    Run a coroutine to completion on the shared event loop.
+
+    Calls are serialized so that Streamlit sessions running in separate
+    threads never drive the loop at the same time.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    loop = get_event_loop()
+    with _lock:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
@@ -0,0 +1,71 @@
+"""Vectorized row filters for the liens table."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+
+# Below this many rows the NumPy path is already fast and avoids JIT/thread startup
+NUMBA_MIN_ROWS = 100_000
+
+
+def _range_mask_numpy(
+    ltv: np.ndarray,
+    face: np.ndarray,
+    max_ltv: float,
+    min_face: float,
+    max_face: float,
+) -> np.ndarray:
+    return (np.isnan(ltv) | (ltv <= max_ltv)) & (face >= min_face) & (face <= max_face)
+
+
+if njit is not None:
+    # No fastmath: it lets the compiler assume NaN never occurs, which breaks
+    # the "unknown LTV passes the filter" rule.
+    @njit(parallel=True, cache=True)
+    def _range_mask_numba(ltv, face, max_ltv, min_face, max_face):
+        n = ltv.size
+        out = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            ok_ltv = np.isnan(ltv[i]) or ltv[i] <= max_ltv
+            out[i] = ok_ltv and face[i] >= min_face and face[i] <= max_face
+        return out
+else:
+    _range_mask_numba = None
+
+
+def range_mask(
+    ltv: np.ndarray,
+    face: np.ndarray,
+    max_ltv: float,
+    min_face: float,
+    max_face: float,
+) -> np.ndarray:
+    """
+    Build the LTV / face-amount filter mask in a single pass.
+
+    Rows with an unknown (NaN) LTV are kept; face amounts must fall within
+    the inclusive range. Large inputs use a parallel Numba kernel when numba
+    is installed, otherwise NumPy.
+
+    Args:
+        ltv: Lien-to-value ratios as float64 (NaN where unknown)
+        face: Face amounts as float64
+        max_ltv: Maximum LTV % to keep
+        min_face: Minimum face amount to keep
+        max_face: Maximum face amount to keep
+
+    Returns:
+        Boolean array, True for rows that pass every predicate
+    """
+    ltv = np.ascontiguousarray(ltv, dtype=np.float64)
+    face = np.ascontiguousarray(face, dtype=np.float64)
+
+    if _range_mask_numba is not None and ltv.size >= NUMBA_MIN_ROWS:
+        return _range_mask_numba(
+            ltv, face, float(max_ltv), float(min_face), float(max_face)
+        )
+    return _range_mask_numpy(ltv, face, max_ltv, min_face, max_face)
@@ -4,6 +4,10 @@ import re
 from typing import Optional
 
 
+# Characters stripped from currency strings before float conversion
+CURRENCY_CHARS_RE = re.compile(r"[$,\s]")
+
+
 def parse_currency(value: Optional[str]) -> Optional[float]:
     """
     Parse currency string to float.
@@ -32,7 +36,7 @@ def parse_currency(value: Optional[str]) -> Optional[float]:
             value = value[1:-1]
 
         # Remove currency symbols, commas, whitespace
-        cleaned = re.sub(r"[$,\s]", "", value)
+        cleaned = CURRENCY_CHARS_RE.sub("", value)
 
         if not cleaned:
             return None